@@ -32,7 +32,7 @@ class MyBot(commands.Bot):
 
             gummy_cog = self.get_cog("LaunchGummy")
             if gummy_cog and gummy_cog.gummy_active:
-                await gummy_cog.send_message(f"change_presence={game_status}")
+                await gummy_cog.send_message(message_type="presence", content=game_status)
 
             print(f"I'm now playing {game_status}!")
         except TypeError as e:
@@ -150,8 +150,8 @@ class BattleShip(commands.Cog):
         if not game:
             return await ctx.send("You are not in a game!")
         
-        view = PageView("Battleship Game Log", game.log_.events)
-        game.log_message = await ctx.send(embed=view.pages[0], view=view)
+        view = PageView("Battleship Game Log", list(game.log_.lines))
+        game.log_message = await ctx.send(embed=view.get_page(0), view=view)
         
     async def end_game_(self, ctx: commands.Context, game: Game):
         """Ends the currently running game.
@@ -70,6 +70,8 @@ class BattleshipBoard(Board):
             A 2D grid representing the board. Each cell contains a symbol to indicate 
             its state (e.g., open water, a ship, or a hit/miss).
     """
+    __slots__ = ()
+
     def __init__(self, size: int=10, default: str=OPEN):
         super().__init__(size=size, default=default)
 
@@ -109,34 +111,6 @@ class BattleshipBoard(Board):
         board += f"{emojis.get('board_bl')}{''.join(numbers)}{emojis.get('board_br')}\n"
         return board
 
-    def is_valid_loc(self, ship: Ship, y: int, x: int, direction: str):
-        """Returns whether or not the given location is a valid placement for a ship.
-        
-        Is used for the initial random placement. 
-        A location is valid if all locations occupied by the ship are only open water.
-        
-        Params:
-        -------
-            ship : Ship
-                The current ship to check.
-            y : int
-                The y coordinate to test the ship.
-            x : int
-                The x coordinate to test the ship.
-            direction : 
-                str The ships's direction, either vertical or horizontal.
-        """
-        dy, dx = (0, 1) if direction == "H" else (1, 0)
-
-        for i in range(ship.size):
-            ny, nx = y + dy * i, x + dx * i
-            if (not 0 <= ny < self.size) or (not 0 <= nx < self.size):
-                return False
-            if self.grid[ny][nx] != OPEN:
-                return False
-
-        return True
-
 
 
 class PlacementBoard(BattleshipBoard):
@@ -150,6 +124,8 @@ class PlacementBoard(BattleshipBoard):
             A 2D grid representing the board. Each cell contains a symbol to indicate 
             its state (e.g., open water, a ship, or a hit/miss).
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -240,6 +216,22 @@ class PlacementBoard(BattleshipBoard):
         
         Ensures that no ships intersect and are within the bounds of the board.
 
+        Params:
+        -------
+            fleet : list[Ship]
+                The player's ships.
+            bot_player : bool
+                If the placing player is a bot or not.
+        """
+        while not self._try_place_ships(fleet, bot_player):
+            pass
+
+    def _try_place_ships(self, fleet: list[Ship], bot_player: bool):
+        """Makes one attempt at randomly placing the fleet on a cleared board.
+
+        Returns `False` if a ship was left with nowhere to go, in which case the
+        placement should be retried.
+
         Params:
         -------
             fleet : list[Ship]
@@ -248,18 +240,75 @@ class PlacementBoard(BattleshipBoard):
                 If the placing player is a bot or not.
         """
         self.clear_board()
+        size = self.size
+        occupied = 0
 
         for ship in fleet:
             ship.locs = []
             ship.confirmed = False
             ship.placed_before = False
 
-            while not ship.placed_before and not ship.confirmed:
-                y, x = random.randint(0, self.size - 1), random.randint(0, self.size - 1)
-                direction = random.choice(["H", "V"])
-                if self.is_valid_loc(ship, y, x, direction):
-                    self._place_ship(ship, y, x, direction, bot_player)
-                    ship.placed_before = True
+            horizontal = self._valid_anchors(occupied, ship.size, "H")
+            vertical = self._valid_anchors(occupied, ship.size, "V")
+            num_horizontal = horizontal.bit_count()
+            num_anchors = num_horizontal + vertical.bit_count()
+            if not num_anchors:
+                return False
+
+            choice = random.randrange(num_anchors)
+            if choice < num_horizontal:
+                anchors, direction, step = horizontal, "H", 1
+            else:
+                anchors, direction, step = vertical, "V", size
+                choice -= num_horizontal
+
+            for _ in range(choice):
+                anchors &= anchors - 1
+            anchor = (anchors & -anchors).bit_length() - 1
+
+            y, x = divmod(anchor, size)
+            self._place_ship(ship, y, x, direction, bot_player)
+            ship.placed_before = True
+
+            for i in range(ship.size):
+                occupied |= 1 << (anchor + step * i)
+
+        return True
+
+    def _valid_anchors(self, occupied: int, ship_size: int, direction: str):
+        """Returns a bitmask of every cell a ship can be anchored at without
+        leaving the board or overlapping an occupied cell.
+
+        Cell `(y, x)` is stored at bit `y * size + x`.
+
+        Params:
+        -------
+            occupied : int
+                A bitmask of the cells that already hold a ship.
+            ship_size : int
+                The size of the ship to place.
+            direction : str
+                The ship's direction, either vertical or horizontal.
+        """
+        size = self.size
+        if ship_size > size:
+            return 0
+
+        if direction == "H":
+            step = 1
+            row_anchors = (1 << (size - ship_size + 1)) - 1
+            in_bounds = 0
+            for y in range(size):
+                in_bounds |= row_anchors << (y * size)
+        else:
+            step = size
+            in_bounds = (1 << ((size - ship_size + 1) * size)) - 1
+
+        blocked = 0
+        for i in range(ship_size):
+            blocked |= occupied >> (step * i)
+
+        return in_bounds & ~blocked
 
     def _place_ship(self, ship: Ship, y: int, x: int, direction: str, bot_player):
         """Places a ship at a given location on the board.
@@ -428,6 +477,8 @@ class DefenseBoard(BattleshipBoard):
             A 2D grid representing the board. Each cell contains a symbol to indicate 
             its state (e.g., open water, a ship, or a hit/miss).
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -471,6 +522,8 @@ class AttackBoard(BattleshipBoard):
             A 2D grid representing the board. Each cell contains a symbol to indicate 
             its state (e.g., open water, a ship, or a hit/miss).
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
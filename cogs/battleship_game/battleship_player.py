@@ -80,6 +80,10 @@ class BattleshipPlayer(Player):
         placement_board_message: discord.Message
             The Discord messaged used to allow the player to place ships.
     """
+    __slots__ = (
+        "fleet", "attack_board", "defense_board", "placement_board", "country",
+        "attack_board_message", "placement_message", "defense_board_message")
+
     def __init__(self, member: discord.Member, is_bot: bool=False):
         super().__init__(member=member, is_bot=is_bot)
         self.fleet = [Ship(size) for size in [2, 3, 3, 4, 5]]
@@ -97,20 +101,22 @@ class BattleshipPlayer(Player):
         """If the player has no remaining ships."""
         return all(ship.is_sunk for ship in self.fleet)
 
-    def set_ship_names(self, names: dict[str, list[str]]):
+    def set_ship_names(self, names: dict[str, tuple[str, ...]]):
         """Sets the names of the ships in the player's fleet.
         
         Names for each ship are determinzed by its `ship_class` and are randomized.
         
         Params:
         -------
-            names: dict[str, list[str]]
-                The possible ship names `(list)` associated with each ship type `(str)`.
+            names: dict[str, tuple[str, ...]]
+                The possible ship names `(tuple)` associated with each ship type `(str)`.
         """
-        for i, ship_class in enumerate(names):
-            ship = self.fleet[i]
+        classes = list(names.items())
+        chosen = [random.choice(class_names) for _, class_names in classes]
+
+        for ship, (ship_class, _), name in zip(self.fleet, classes, chosen):
             ship.ship_class = ship_class
-            ship.name = random.choice(names[ship_class])
+            ship.name = name
 
     async def choose_ship_placement(self, ctx: commands.Context):
         """Handles the player's ship placement by using buttons and a dropdown for ship selection.
@@ -4,6 +4,7 @@
 
 import os
 
+from functools import lru_cache
 from ..utils import JsonLoader
 
 
@@ -14,6 +15,19 @@ SHIP_NAMES_FILE = os.path.abspath(
 ship_names = JsonLoader.load_json(SHIP_NAMES_FILE)
 """Stores the possible ship names for each country and class of ship."""
 
+@lru_cache(maxsize=None)
+def get_ship_name_pool(country: str) -> dict[str, tuple[str, ...]]:
+    """Returns the possible ship names for each class of ship for the given country.
+    
+    The pools are built once per country and shared between games.
+
+    Params:
+    -------
+        country : str
+            The country to get the ship names for.
+    """
+    return {ship_class: tuple(names) for ship_class, names in ship_names[country].items()}
+
 BOT_MESSAGES_FILE = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "../../data/bot_messages.json"))
 
@@ -47,7 +47,7 @@ from asyncio import sleep
 from discord.ext import commands
 from typing import Optional
 from .battleship_player import BattleshipPlayer
-from .constants import bot_messages, ship_names
+from .constants import bot_messages, get_ship_name_pool, ship_names
 from .country_view import CountryView
 from ..utils import EventLog
 
@@ -158,8 +158,8 @@ class Game:
         while not player_1.country or not player_2.country:
             await sleep(5)
 
-        player_1.set_ship_names(ship_names[player_1.country])
-        player_2.set_ship_names(ship_names[player_2.country])
+        player_1.set_ship_names(get_ship_name_pool(player_1.country))
+        player_2.set_ship_names(get_ship_name_pool(player_2.country))
         self.country_message = await self.country_message.edit(view=None)
 
         await sleep(2)
@@ -303,7 +303,7 @@ class Game:
 
             await sleep(1)
             if sunk:
-                self.attack_messasge.reply(
+                await self.attack_messasge.reply(
                     random.choice(bot_messages.get("sunk_messages")))
         else:
             self.attack_messasge = await self.attack_messasge.edit(
@@ -5,7 +5,6 @@ The `Connect Four` game package. Includes game elements and constants.
 
 
 from .botlogic import BotLogic
-from .connect_board import Board
+from .connect_board import Board, ConnectFourBoard, Symbol
 from .connect_player import ConnectFourPlayer
 from .game import Game
-from .game_utils import is_winner
@@ -1,93 +1,124 @@
-
 import random
 
-from .connect_board import ConnectFourBoard
-from .game_utils import is_winner
-
-
-
-OPEN = "⏹️"
+from collections import OrderedDict
+from .connect_board import ConnectFourBoard, Symbol
 
 
 
 class BotLogic:
-    def __init__(self, board: ConnectFourBoard, symbol: str):
+    """The bot's strategy for choosing where to drop its pieces in Connect Four.
+
+    Attributes:
+    -----------
+        board : ConnectFourBoard
+            The board of the game the bot is playing.
+        symbol : Symbol
+            The bot's symbol.
+        opponent_symbol : Symbol
+            The opponent's symbol.
+        col_order : tuple[int, ...]
+            The columns from the center outwards, the order in which moves are tried.
+        max_transpositions : int
+            The number of positions to remember moves for, shared between all games.
+    """
+    _transpositions: OrderedDict[tuple[int, int, Symbol], int] = OrderedDict()
+    max_transpositions = 50_000
+
+    def __init__(self, board: ConnectFourBoard, symbol: Symbol, opponent_symbol: Symbol):
         self.board = board
         self.symbol = symbol
-
-    def find_winning_col(self, symbol: str):
-        for col in range(self.board.size):
-            try:
-                open_row = self.board.get_next_open(col)
-                self.board[open_row][col] = symbol
-
-                if is_winner(self.board, symbol):
-                    self.board[open_row][col] = OPEN
-                    return col
-
-                self.board[open_row][col] = OPEN
-            except IndexError:
+        self.opponent_symbol = opponent_symbol
+        self.col_order = tuple(sorted(range(board.size), key=lambda col: abs(col - board.size // 2)))
+
+    @classmethod
+    def clear_transpositions(cls):
+        """Forgets every remembered move, so that moves chosen by older logic are not reused."""
+        cls._transpositions.clear()
+
+    def find_best_col(self):
+        """Returns the column to drop in, or `-1` if the board is full.
+        
+        Takes a winning column if there is one, otherwise blocks the opponent's winning
+        column, otherwise picks the column that makes the largest cluster. The chosen
+        column is remembered for each position, so positions seen in earlier games are
+        not searched again.
+        """
+        board = self.board
+        key = (board.size, board.zobrist_key, self.symbol)
+
+        transpositions = self._transpositions
+        col = transpositions.get(key)
+        if col is not None:
+            transpositions.move_to_end(key)
+            return col
+
+        col = self.find_winning_col(self.symbol)
+        if col is None:
+            col = self.find_winning_col(self.opponent_symbol)
+        if col is None:
+            col = self.find_cluster()
+
+        transpositions[key] = col
+        if len(transpositions) > self.max_transpositions:
+            transpositions.popitem(last=False)
+
+        return col
+
+    def find_winning_col(self, symbol: Symbol):
+        board = self.board
+        size = board.size
+        heights = board.heights
+        for col in self.col_order:
+            height = heights[col]
+            if height == size:
                 continue
 
+            if board.check_win_at(size - 1 - height, col, symbol):
+                return col
+
         return None
 
     def find_cluster(self):
         best_cluster = -1
         best_col = -1
 
-        for col in range(self.board.size):
-            try:
-                open_row = self.board.get_next_open(col)
-                self.board[open_row][col] = self.symbol
-
-                cluster = self.eval_cluster(open_row, col, self.symbol)
-                if cluster > best_cluster:
-                    best_cluster = cluster
-                    best_col = col
+        board = self.board
+        size = board.size
+        heights = board.heights
+        symbol = self.symbol
+        for col in self.col_order:
+            height = heights[col]
+            if height == size:
+                continue
 
-                self.board[open_row][col] = OPEN
-            except IndexError as e:
-                print(f"Error when trying bot move at {open_row}, {open_row}: {e}")
+            cluster = self.eval_cluster(size - 1 - height, col, symbol)
+            if cluster > best_cluster:
+                best_cluster = cluster
+                best_col = col
 
         return best_col
 
-    def eval_cluster(self, row: int, col: int, symbol: str):
-        moves = [
-            (0, 1),
-            (1, 0),
-            (1, 1),
-            (1, -1)
-        ]
+    def eval_cluster(self, row: int, col: int, symbol: Symbol):
+        board = self.board
+        pieces = board.bitboards[symbol]
+        pos = board.get_pos(row, col)
 
         cluster_size = 0
-        for dr, dc in moves:
-            count = 0
-            new_row, new_col = row + dr, col + dc
-            while (0 <= new_row < self.board.size and 
-                0 <= new_col < self.board.size and
-                self.board[new_row][new_col] == symbol):
-
-                count += 1
-                new_row += dr
-                new_col += dc
-
-            new_row, new_col = row - dr, col - dc
-            while (0 <= new_row < self.board.size and 
-                0 <= new_col < self.board.size and
-                self.board[new_row][new_col] == symbol):
-
-                count += 1
-                new_row -= dr
-                new_col -= dc
+        for shift in board.win_shifts:
+            next_pos = pos + shift
+            while pieces >> next_pos & 1:
+                cluster_size += 1
+                next_pos += shift
 
-            cluster_size += count
+            next_pos = pos - shift
+            while next_pos >= 0 and pieces >> next_pos & 1:
+                cluster_size += 1
+                next_pos -= shift
 
         return cluster_size
 
     def select_random_col(self):
-        open_cols = [
-            col for col in range(self.board.size)
-            if OPEN in [row[col] for row in self.board]
-        ]
+        open_cols_mask = self.board.open_cols
+        open_cols = [col for col in range(self.board.size) if open_cols_mask >> col & 1]
 
         return random.choice(open_cols) if open_cols else -1
\ No newline at end of file
@@ -1,6 +1,23 @@
 import discord
+import random
 
-from ..game_elements import Board
+from enum import IntEnum
+from ..game_elements import Board, OPEN
+
+
+
+class Symbol(IntEnum):
+    """The pieces that can be in a space of the board."""
+    EMPTY = 0
+    P1 = 1
+    P2 = 2
+
+
+SYMBOL_EMOJIS = (OPEN, "🟪", "🟥")
+"""The emoji used to display each `Symbol` on the board."""
+
+WIN_LENGTH = 4
+"""The number of pieces in a row needed to win."""
 
 
 
@@ -11,18 +28,123 @@ class ConnectFourBoard(Board):
         size : int
             The size of the board.
         grid : list[list[str]]
-            A grid that represents the spaces of the board.
+            A grid of the emoji for each space, used to display the board.
+        stride : int
+            The number of bits used by each column of a bitboard, one more than the board
+            size so that every column has an empty sentinel bit above it.
+        win_shifts : tuple[int, int, int, int]
+            The bitboard shifts between neighbouring positions vertically, horizontally
+            and along both diagonals.
+        bitboards : list[int]
+            The pieces of each player, indexed by their `Symbol`. The piece `n` rows
+            from the bottom of column `col` is stored at bit `col * stride + n`.
+        heights : list[int]
+            The number of pieces in each column.
+        open_cols : int
+            A bitmask of the columns that are not full, bit `col` is set for an open column.
+        winning_lines : tuple[tuple[int, ...], ...]
+            The masks of every four-in-a-row line through each bitboard position.
+        last_move : tuple[int, int]
+            The `(row, col)` position of the last dropped piece.
+        zobrist_table : tuple[tuple[int, ...], ...]
+            A random 64-bit key for each symbol at each bitboard position.
+        zobrist_key : int
+            The XOR of the keys of every piece on the board, identifies the position.
     """
+    __slots__ = (
+        "stride", "win_shifts", "bitboards", "heights", "open_cols", "winning_lines",
+        "last_move", "zobrist_table", "zobrist_key", "_embed")
+
+    _winning_lines: dict[int, tuple[tuple[int, ...], ...]] = {}
+    _zobrist_tables: dict[int, tuple[tuple[int, ...], ...]] = {}
+
     def __init__(self, size: int=7):
         super().__init__(size=size)
+        self.stride = size + 1
+        self.win_shifts = (1, self.stride, self.stride + 1, self.stride - 1)
+        self.bitboards = [0] * len(Symbol)
+        self.heights = [0] * size
+        self.open_cols = (1 << size) - 1
+        self.winning_lines = self.get_winning_lines(size)
+        self.last_move: tuple[int, int] = None
+        self.zobrist_table = self.get_zobrist_table(size)
+        self.zobrist_key = 0
+        self._embed: discord.Embed = None
+
+    @classmethod
+    def get_winning_lines(cls, size: int):
+        """Returns the masks of every four-in-a-row line through each bitboard position
+        for a board of the given size.
+
+        The lines are only generated once for each board size.
+
+        Params:
+        -------
+            size : int
+                The size of the board.
+        """
+        if size not in cls._winning_lines:
+            stride = size + 1
+            lines: list[list[int]] = [[] for _ in range(size * stride)]
+
+            for col in range(size):
+                for height in range(size):
+                    for dc, dh in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                        if not (0 <= col + 3 * dc < size and 0 <= height + 3 * dh < size):
+                            continue
+
+                        positions = [(col + i * dc) * stride + height + i * dh for i in range(4)]
+                        line = sum(1 << pos for pos in positions)
+                        for pos in positions:
+                            lines[pos].append(line)
+
+            cls._winning_lines[size] = tuple(tuple(pos_lines) for pos_lines in lines)
+
+        return cls._winning_lines[size]
+
+    @classmethod
+    def get_zobrist_table(cls, size: int):
+        """Returns the random keys of each symbol at each bitboard position for a board
+        of the given size.
+
+        The table is only generated once for each board size, seeded by the size so that
+        keys are the same for every board.
+
+        Params:
+        -------
+            size : int
+                The size of the board.
+        """
+        if size not in cls._zobrist_tables:
+            rng = random.Random(size)
+            positions = size * (size + 1)
+            cls._zobrist_tables[size] = tuple(
+                tuple(rng.getrandbits(64) for _ in range(positions)) for _ in Symbol)
+
+        return cls._zobrist_tables[size]
 
     @property
     def embed(self):
-        """An embed the shows the current state of the board."""
-        return discord.Embed(
-            title="Connect Four!",
-            description=f"{self}",
-            color=discord.Color.red())
+        """An embed the shows the current state of the board.
+        
+        The embed is only rebuilt after the board changes, a copy is returned so
+        that callers can modify it freely.
+        """
+        if self._embed is None:
+            self._embed = discord.Embed(
+                title="Connect Four!",
+                description=f"{self}",
+                color=discord.Color.red())
+
+        return self._embed.copy()
+
+    @property
+    def is_full(self):
+        """If the board is full.
+        
+        Pieces settle to the bottom of each column, so only the top row needs to be checked.
+        """
+        return self.default not in self.grid[0]
 
     def get_next_open(self, col: int):
         """Returns the next open row in the column, closest to the bottom of the board.
@@ -33,16 +155,58 @@ class ConnectFourBoard(Board):
                 The column number to check.
         
         Throws an `IndexError` if the column number is invalid or if the column is full."""
-        if not 0 <= col < self.size:
+        size = self.size
+        if not 0 <= col < size:
             raise IndexError(f"The column {col} is not valid.")
 
-        try:
-            return next(row for row in range(self.size - 1, -1, -1) 
-                if self[row][col] == self.default)
-        except StopIteration:
+        height = self.heights[col]
+        if height == size:
             raise IndexError(f"The column {col} is full.")
 
-    def drop(self, row: int, col: int, symbol: str):
+        return size - 1 - height
+
+    def get_pos(self, row: int, col: int):
+        """Returns the bitboard index for the given position.
+
+        Params:
+        -------
+            row : int
+                The row of the position.
+            col : int
+                The column of the position.
+        """
+        return col * self.stride + self.size - 1 - row
+
+    def check_win_at(self, row: int, col: int, symbol: Symbol):
+        """Returns whether or not a piece of the given symbol at the given position
+        completes four in a row.
+
+        Only the lines through that position are checked, and the piece does not have
+        to be dropped yet. No line is checked until the symbol has enough pieces,
+        counting this one, to fill a line.
+
+        Params:
+        -------
+            row : int
+                The row of the piece.
+            col : int
+                The column of the piece.
+            symbol : Symbol
+                The player's symbol.
+        """
+        pos = self.get_pos(row, col)
+        bit = 1 << pos
+        pieces = self.bitboards[symbol] | bit
+        if pieces.bit_count() < WIN_LENGTH:
+            return False
+
+        for line in self.winning_lines[pos]:
+            if pieces & line == line:
+                return True
+
+        return False
+
+    def drop(self, row: int, col: int, symbol: Symbol):
         """Drops a piece to the lowest position in the given column.
         
         Params:
@@ -51,7 +215,16 @@ class ConnectFourBoard(Board):
                 The lowest open row in the board.
             col : int
                 The column to drop into.
-            symbol : str
+            symbol : Symbol
                 The player's symbol.
         """
-        self[row][col] = symbol
+        pos = self.get_pos(row, col)
+        self[row][col] = SYMBOL_EMOJIS[symbol]
+        self.bitboards[symbol] |= 1 << pos
+        self.zobrist_key ^= self.zobrist_table[symbol][pos]
+        self.heights[col] += 1
+        if self.heights[col] == self.size:
+            self.open_cols &= ~(1 << col)
+
+        self.last_move = (row, col)
+        self._embed = None
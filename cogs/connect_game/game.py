@@ -1,3 +1,4 @@
+import asyncio
 import discord
 
 from asyncio import sleep
@@ -5,11 +6,11 @@ from discord.ext import commands
 from .connect_board import ConnectFourBoard
 from .connect_player import ConnectFourPlayer
 from .botlogic import BotLogic
-from .game_utils import is_winner
 
 
 
-OPEN = "⏹️"
+BOT_THINK_DELAY = 3
+"""How long the bot waits before dropping its piece, in seconds."""
 
 
 
@@ -27,20 +28,26 @@ class Game:
         self.bot = bot
         self.player_1 = player_1
         self.player_2 = player_2
+        self.player_1_id = player_1.id
+        self.player_2_id = player_2.id
         self.board = ConnectFourBoard()
 
         if self.player_2.is_bot:
-            self.bot_logic = BotLogic(self.board, self.player_2.symbol)
+            self.bot_logic = BotLogic(self.board, self.player_2.symbol, self.player_1.symbol)
 
         self.current_player: ConnectFourPlayer = None
         self.winner: ConnectFourPlayer = None
         self.board_message: discord.Message = None
-        self.turn_message: discord.Message = None
 
     @property
     def current_player_won(self):
-        """If the current player won."""
-        return is_winner(self.board, self.current_player.symbol)
+        """If the current player won with the last dropped piece."""
+        last_move = self.board.last_move
+        if not last_move:
+            return False
+
+        row, col = last_move
+        return self.board.check_win_at(row, col, self.current_player.symbol)
 
     @property
     def game_state(self):
@@ -63,10 +70,18 @@ class Game:
     @property
     def is_bot_turn(self):
         """If it is currently the bot's turn, if the bot is in the game."""
-        return self.current_player == self.player_2 and self.current_player.is_bot
+        return self.current_player is self.player_2 and self.player_2.is_bot
+
+    @property
+    def turn_text(self):
+        """A message indicating whose turn it is."""
+        if self.is_bot_turn:
+            return "It's now my turn!"
+
+        return f"{self.current_player.mention}, it is now your turn!"
 
     async def setup(self, ctx: commands.Context):
-        """Sets the initial game state and sends the game board and turn message.
+        """Sets the initial game state and sends the game board along with the turn message.
         
         Params:
             ctx : commands.Context
@@ -75,21 +90,16 @@ class Game:
         self.current_player = self.player_1
 
         embed = self.board.embed
-        self.board_message = await ctx.send(embed=embed)
-        self.turn_message = await ctx.send(f"{self.current_player.mention}, you are going first!")
+        self.board_message = await ctx.send(
+            f"{self.current_player.mention}, you are going first!", embed=embed)
 
     async def cleanup(self):
-        """Sends the final game state and cleans up the messages.."""
-        try:
-            await self.turn_message.delete()
-        except discord.errors.NotFound as e:
-            print(f"The turn message was not found: {e}")
-
+        """Sends the final game state and clears the turn message."""
         embed = self.board.embed
         embed.set_footer(text="This game has ended.")
 
         try:
-            self.board_message = await self.board_message.edit(embed=embed)
+            self.board_message = await self.board_message.edit(content=None, embed=embed)
         except discord.errors.NotFound as e:
             print(f"The board message was not found: {e}")
 
@@ -101,10 +111,10 @@ class Game:
             player_id : int
                 The id to use for searching.
         """
-        if self.player_1.member.id == player_id:
+        if player_id == self.player_1_id:
             return self.player_1
 
-        if self.player_2.member.id == player_id:
+        if player_id == self.player_2_id:
             return self.player_2
 
     def _is_player_turn(self, player: ConnectFourPlayer):
@@ -115,7 +125,7 @@ class Game:
             player : ConnectFourPlayer
                 The player to check.
         """
-        return self.current_player == player
+        return player is self.current_player
 
     async def player_turn(self, ctx: commands.Context, col: int, player_id: int):
         """Handles a player's turn after they call the `drop` command.
@@ -144,23 +154,15 @@ class Game:
 
         symbol = player.symbol
         self.board.drop(open_row, col_index, symbol)
-        await ctx.send(f"Dropping piece into column {col}", delete_after=5)
 
         await self._next_turn() 
 
     async def _do_bot_turn(self):
         """Represents the bot's turn."""
         bot_symbol = self.player_2.symbol
-        col = self.bot_logic.find_winning_col(bot_symbol)
-
-        if not col:
-            player_symbol = self.player_1.symbol
-            col = self.bot_logic.find_winning_col(player_symbol)
+        col = self.bot_logic.find_best_col()
 
-        if not col:
-            col = self.bot_logic.find_cluster()
-
-        if not col:
+        if col == -1:
             col = self.bot_logic.select_random_col()
 
         try:
@@ -174,30 +176,24 @@ class Game:
     async def _next_turn(self):
         """Checks the game's state to determine if the game should continue and move to the next turn.
         
-        Also updates the board embed message and current turn message.
+        Also updates the board message with the new board and whose turn it is.
         """
-        embed = self.board.embed
-        self.board_message = await self.board_message.edit(embed=embed)
-
         state = self.game_state
-        if state == "win":
-            self.winner = self.current_player
-            return await self.bot.get_cog("ConnectFour").end_game(game=self)
-        elif state == "draw":
+        if state != "ongoing":
+            if state == "win":
+                self.winner = self.current_player
+
             return await self.bot.get_cog("ConnectFour").end_game(game=self)
 
         self.current_player = (
-            self.player_1 if self.current_player == self.player_2 else self.player_2)
+            self.player_1 if self.current_player is self.player_2 else self.player_2)
 
-        await self._handle_turn_message()
-        if self.is_bot_turn:
-            await self._do_bot_turn()
+        embed = self.board.embed
+        edit = self.board_message.edit(content=self.turn_text, embed=embed)
 
-    async def _handle_turn_message(self):
-        """Sends a message indicating whose turn it is."""
-        if self.is_bot_turn:
-            self.turn_message = await self.turn_message.edit(content="It's now my turn!")
-            await sleep(3)
-        else:
-            self.turn_message = await self.turn_message.edit(
-                content=f"{self.current_player.mention}, it is now your turn!")
+        if not self.is_bot_turn:
+            self.board_message = await edit
+            return
+
+        self.board_message, _ = await asyncio.gather(edit, sleep(BOT_THINK_DELAY))
+        await self._do_bot_turn()
@@ -3,7 +3,7 @@ import discord
 import asyncio
 from discord.ext import commands
 from typing import Optional
-from .connect_game import ConnectFourPlayer, Game
+from .connect_game import BotLogic, ConnectFourPlayer, Game, Symbol
 
 
 
@@ -15,12 +15,17 @@ class ConnectFour(commands.Cog):
         bot : commands.Bot
             The current bot instance.
         player_games : dict[int, Game]
-            Stores the games associated with each player.
+            Stores the games associated with each player. The bot is never stored, 
+            so it can play several games at once.
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.player_games: dict[int, Game] = {}
 
+    async def cog_load(self):
+        """Clears the bot's remembered moves whenever the cog is (re)loaded."""
+        BotLogic.clear_transpositions()
+
     @commands.hybrid_command(name="connectfour", aliases=["c4"])
     async def _start(self, ctx: commands.Context, member: Optional[discord.Member]=None):
         """Starts a game of Connect Four between two players, or against me!
@@ -35,7 +40,7 @@ class ConnectFour(commands.Cog):
             member : discord.Member
                 The other Discord `member` to play against. If `None`, plays agains the bot.
         """
-        player_1 = ConnectFourPlayer(member=ctx.author, symbol="🟪")
+        player_1 = ConnectFourPlayer(member=ctx.author, symbol=Symbol.P1)
 
         if member and member.bot and member != self.bot.user:
             return await ctx.send("Can't play against that bot, they are not smart enough!")
@@ -43,7 +48,7 @@ class ConnectFour(commands.Cog):
         is_bot = member is None
         player_2 = ConnectFourPlayer(
             member=member if not is_bot else self.bot.user, 
-            symbol="🟥", 
+            symbol=Symbol.P2, 
             is_bot=is_bot)
 
         if (player_1.id in self.player_games or 
@@ -55,7 +60,9 @@ class ConnectFour(commands.Cog):
 
         game = Game(self.bot, player_1, player_2)
         self.player_games[player_1.id] = game
-        self.player_games[player_2.id] = game
+        if not is_bot:
+            self.player_games[player_2.id] = game
+
         await game.setup(ctx)
 
     @commands.hybrid_command(name="drop")
@@ -105,7 +112,12 @@ class ConnectFour(commands.Cog):
             await self.end_game(game)
 
     async def end_game(self, game: Game):
-        """Sends the final state of the game and cleans it up."""
+        """Sends the final state of the game and cleans it up.
+
+        The final board is edited into the board message before the result is replied to it.
+        """
+        await self.cleanup(game)
+
         winner = game.winner
         if not winner:
             message = "The game has ended in a draw."
@@ -113,7 +125,6 @@ class ConnectFour(commands.Cog):
             message = f"{winner.name} has won the game! 🎉"
 
         await game.board_message.reply(message)
-        await self.cleanup(game)
 
     async def cleanup(self, game: Game):
         """Cleans up the game instance and delete it from the stored player games.
@@ -125,10 +136,8 @@ class ConnectFour(commands.Cog):
         """
         await game.cleanup()
 
-        player_1 = game.player_1
-        player_2 = game.player_2
-        del self.player_games[player_1.member.id]
-        del self.player_games[player_2.member.id]
+        self.player_games.pop(game.player_1.id, None)
+        self.player_games.pop(game.player_2.id, None)
 
 
 async def setup(bot: commands.Bot):
@@ -42,6 +42,11 @@ from .dnd_game import Dice, DiceView
 
 
 
+ROLL_PATTERN = re.compile(r"^(\d+)d(\d+)$")
+"""Matches roll strings in the `XdY` format."""
+
+
+
 class DnD(commands.Cog):
     """Commands to represent Dungeons and Dragons dice, characters sheets, and more.
     
@@ -54,8 +59,7 @@ class DnD(commands.Cog):
     def is_valid_roll(self, roll: str):
         """Returns the number of rolls and sides of the dice if the roll string is valid,
         or `None` if it is not valid."""
-        pattern = r"^(\d+)d(\d+)$"
-        result = re.match(pattern, roll)
+        result = ROLL_PATTERN.match(roll)
         if not result:
             return None
 
@@ -1,2 +1,2 @@
-from .dice import Dice
+from .dice import Dice, RollResult
 from .diceview import DiceView
\ No newline at end of file
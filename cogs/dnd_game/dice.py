@@ -1,50 +1,110 @@
 import discord
+import numpy as np
 
-from random import randint
+
+
+DICE_COLOR = discord.Color.fuchsia().value
+"""The color of the dice embeds."""
+
+DICE_IMAGE_URL = "https://i.imgur.com/kmJYja0.png"
+"""The image shown in the dice embeds."""
+
+ROLL_TYPE_NAMES = {
+    "normal": "Normal",
+    "advantage": "Advantage",
+    "disadvantage": "Disadvantage",
+}
+"""The display name of each roll type."""
+
+ROLL_STRINGS = tuple(str(roll) for roll in range(101))
+"""The text of each roll up to 100, the most sides the roll command allows."""
+
+
+
+class RollResult():
+    """The outcome of rolling a dice some number of times.
+
+    Attributes:
+    -----------
+        rolls : list[int]
+            Each roll in order.
+        high : int
+            The highest roll, used for advantage.
+        low : int
+            The lowest roll, used for disadvantage.
+        total : int
+            The sum of the rolls.
+    """
+    __slots__ = ("rolls", "high", "low", "total")
+
+    def __init__(self, rolls: list[int], high: int, low: int, total: int):
+        self.rolls = rolls
+        self.high = high
+        self.low = low
+        self.total = total
+
+    @classmethod
+    def from_rolls(cls, rolls: list[int]):
+        """Returns the result of the given rolls.
+
+        Params:
+        -------
+            rolls : list[int]
+                The rolls.
+        """
+        return cls(rolls, max(rolls), min(rolls), sum(rolls))
 
 
 
 class Dice():
+    __slots__ = ("num_sides", "_base_dict")
+    _rng = np.random.default_rng()
+
     def __init__(self, num_sides: int):
         self.num_sides = num_sides
+        self._base_dict = {
+            "title": "Let's go gampling!",
+            "color": DICE_COLOR,
+            "image": {"url": DICE_IMAGE_URL}}
 
     def roll(self, num_rolls: int=1):
-        rolls: list[int] = []
-        for _ in range(num_rolls):
-            roll = randint(1, self.num_sides)
-            rolls.append(roll)
-
-        return rolls
-
-    def get_embed(self, num_rolls: int, rolls: list[int]=[], roll_type: str="normal"):
-        embed = discord.Embed(
-            title="Let's go gampling!",
-            description=f"**Rolling** `{num_rolls}d{self.num_sides}`",
-            color=discord.Color.fuchsia(),
-        )
-        
-        embed.add_field(
-            name="Roll Type: ",
-            value=f"`{roll_type.capitalize()}`",
-        )
-        embed.add_field(
-            name="All Rolls:",
-            value=f"`{', '.join(map(str, rolls))}`" if rolls else "....."
-        )
-
-        if roll_type == "advantage":
-            value = str(max(rolls))
-        elif roll_type == "disadvantage":
-            value = str(min(rolls))
-        elif roll_type == "normal" and rolls:
-            value = str(sum(rolls))
-        else:
+        """Returns the given number of rolls, generated with numpy in one call.
+
+        Params:
+        -------
+            num_rolls : int
+                The number of rolls.
+        """
+        return self._rng.integers(1, self.num_sides + 1, size=num_rolls, dtype=np.int32).tolist()
+
+    def get_embed(self, num_rolls: int, result: RollResult=None, roll_type: str="normal"):
+        if not result:
+            all_rolls = "....."
             value = "Waiting for roll..."
+        else:
+            to_str = ROLL_STRINGS.__getitem__ if self.num_sides < len(ROLL_STRINGS) else str
+            all_rolls = f"`{', '.join(map(to_str, result.rolls))}`"
+            if roll_type == "advantage":
+                value = str(result.high)
+            elif roll_type == "disadvantage":
+                value = str(result.low)
+            else:
+                value = str(result.total)
 
-        embed.add_field(
-            name="**You rolled: **",
-            value=f"`{value}`",
-            inline=False)
-        
-        embed.set_image(url="https://i.imgur.com/kmJYja0.png")
-        return embed
+        return discord.Embed.from_dict({
+            **self._base_dict,
+            "description": f"**Rolling** `{num_rolls}d{self.num_sides}`",
+            "fields": [
+                {
+                    "name": "Roll Type: ",
+                    "value": f"`{ROLL_TYPE_NAMES.get(roll_type) or roll_type.capitalize()}`",
+                    "inline": True},
+                {
+                    "name": "All Rolls:",
+                    "value": all_rolls,
+                    "inline": True},
+                {
+                    "name": "**You rolled: **",
+                    "value": f"`{value}`",
+                    "inline": False},
+            ]})
@@ -1,6 +1,12 @@
 import discord
 
-from .dice import Dice
+from collections import deque
+from .dice import Dice, RollResult
+
+
+
+ROLL_BLOCK_SIZE = 64
+"""The number of rolls generated at once and handed out over later button presses."""
 
 
 
@@ -22,6 +28,18 @@ class DiceView(discord.ui.View):
         super().__init__(timeout=timeout)
         self.dice = dice
         self.num_rolls = num_rolls
+        self._buffer: deque[int] = deque()
+
+    def _next_rolls(self):
+        """Returns the result of the next `num_rolls` rolls, generating a new block of
+        rolls if there are not enough left."""
+        buffer = self._buffer
+        num_rolls = self.num_rolls
+        if len(buffer) < num_rolls:
+            buffer.extend(self.dice.roll(max(ROLL_BLOCK_SIZE, num_rolls)))
+
+        popleft = buffer.popleft
+        return RollResult.from_rolls([popleft() for _ in range(num_rolls)])
 
     @discord.ui.button(label="Roll", style=discord.ButtonStyle.blurple)
     async def roll_button_(
@@ -39,8 +57,8 @@ class DiceView(discord.ui.View):
                 The button object.
         """
 
-        rolls = self.dice.roll(self.num_rolls)
-        embed = self.dice.get_embed(self.num_rolls, rolls)
+        result = self._next_rolls()
+        embed = self.dice.get_embed(self.num_rolls, result)
 
         await interaction.response.edit_message(embed=embed)
 
@@ -60,8 +78,8 @@ class DiceView(discord.ui.View):
                 The button object.
         """
 
-        rolls = self.dice.roll(self.num_rolls)
-        embed = self.dice.get_embed(self.num_rolls, rolls, "advantage")
+        result = self._next_rolls()
+        embed = self.dice.get_embed(self.num_rolls, result, "advantage")
 
         await interaction.response.edit_message(embed=embed)
 
@@ -80,7 +98,7 @@ class DiceView(discord.ui.View):
             button : Button
                 The button object.
         """
-        rolls = self.dice.roll(self.num_rolls)
-        embed = self.dice.get_embed(self.num_rolls, rolls, "disadvantage")
+        result = self._next_rolls()
+        embed = self.dice.get_embed(self.num_rolls, result, "disadvantage")
 
         await interaction.response.edit_message(embed=embed)
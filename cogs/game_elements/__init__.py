@@ -1,4 +1,4 @@
 
 
 from .player import Player
-from .board import Board
\ No newline at end of file
+from .board import Board, OPEN
\ No newline at end of file
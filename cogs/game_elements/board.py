@@ -1,3 +1,6 @@
+OPEN = "⏹️"
+"""Represents an open space."""
+
 
 
 class Board:
@@ -10,7 +13,9 @@ class Board:
         grid : list[list[str]]
             A 2D grid representing the board.
     """
-    def __init__(self, size: int=8, default: str="⏹️"):
+    __slots__ = ("default", "size", "grid")
+
+    def __init__(self, size: int=8, default: str=OPEN):
         self.default = default
         self.size = size
         self.grid = [[default for _ in range(self.size)] for _ in range(self.size)]
@@ -18,18 +23,15 @@ class Board:
     def __getitem__(self, index: int):
         return self.grid[index]
 
-    def __setitem__(self, index: int, val: str):
+    def __setitem__(self, index: int, val: list[str]):
         self.grid[index] = val
 
     def __str__(self):
         """Returns a string representation of the board."""
-        board = ""
-        for row in self.grid:
-            board += f"{''.join(col for col in row)}\n"
-
-        return board
+        return "\n".join(map("".join, self.grid)) + "\n"
 
     @property
     def is_full(self):
         """If the board is full."""
-        return not any(self.default in row for row in self.grid)
\ No newline at end of file
+        default = self.default
+        return not any(default in row for row in self.grid)
@@ -10,30 +10,29 @@ class Player:
             The Discord member associated with the player.
         is_bot : bool
             If the player is a bot.
+        id : int
+            The player's Discord ID.
+        mention : str
+            Mention the player.
+        name : str
+            The player's Discord name.
     """
+    __slots__ = ("member", "is_bot", "id", "mention", "name")
+
     def __init__(self, member: discord.Member, is_bot: bool=False):
         self.member = member
         self.is_bot = is_bot
+        self.id = member.id
+        self.mention = member.mention
+        self.name = member.name
 
     def __eq__(self, other: "Player"):
-        return self.member.id == other.member.id
+        return isinstance(other, Player) and self.id == other.id
+
+    def __hash__(self):
+        return self.id
 
     @property
     def avatar_url(self):
         """The player's Discord avatar."""
         return self.member.avatar.url
-
-    @property
-    def id(self):
-        """The player's Discord ID."""
-        return self.member.id
-
-    @property
-    def mention(self):
-        """Mention the player."""
-        return self.member.mention
-
-    @property
-    def name(self):
-        """The player's Discord name."""
-        return self.member.name
@@ -6,8 +6,19 @@ import os
 import sys
 
 from discord.ext import commands
+from typing import Awaitable, Callable
 from dotenv import load_dotenv
-from ..utils.errors import InvalidGummyMessage, InvalidGummyMessageChannel
+from ..utils.errors import GummyMessageError, InvalidGummyMessage, InvalidGummyMessageChannel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+json_loads = orjson.loads if orjson else json.loads
+"""Parses a message from Gummy, using `orjson` when it is installed. Its decode errors
+subclass `json.JSONDecodeError`."""
 
 
 
@@ -22,46 +33,112 @@ class GummyBot(commands.Bot):
             "tictactoe",
             "videocontroller"
         ]
+        self._handlers = {
+            "presence": self._handle_presence,
+            "command": self._handle_command,
+            "message": self._handle_message,
+        }
+        self._channel_cache: dict[str, discord.abc.Messageable] = {}
+        self._listen_task: asyncio.Task = None
+        self._read_line: Callable[[], Awaitable[bytes]] = None
+
+    def _resolve_channel(self, message_data: dict[str, str]):
+        """Returns the channel that the message refers to.
+
+        Channels are cached by their raw id until they are deleted.
+
+        Params:
+        -------
+            message_data : dict[str, str]
+                The message sent to Gummy.
+
+        Throws an `InvalidGummyMessageChannel` if the channel id is missing or invalid.
+        """
+        channel_id = message_data.get("channel_id")
+        channel = self._channel_cache.get(channel_id)
+        if channel:
+            return channel
+
+        channel = self.get_channel(int(channel_id)) if channel_id else None
+        if not channel:
+            raise InvalidGummyMessageChannel("Invalid channel id.")
+
+        self._channel_cache[channel_id] = channel
+        return channel
+
+    async def _handle_presence(self, message_data: dict[str, str]):
+        """Sets Gummy's status to the message content."""
+        status = message_data.get("content")
+        await self.change_presence(activity=discord.Game(name=status))
+
+    async def _handle_command(self, message_data: dict[str, str]):
+        """Responds to a command run on the main bot."""
+        channel = self._resolve_channel(message_data)
+        if message_data.get("content") == "ahoy":
+            await channel.send("Ahoy! 🏴‍☠️")
+
+    async def _handle_message(self, message_data: dict[str, str]):
+        """Sends the message content to the message's channel."""
+        channel = self._resolve_channel(message_data)
+        await channel.send(message_data.get("content"))
+
+    async def _open_stdin(self):
+        """Returns a coroutine function that reads the next line from stdin, or an empty
+        line once stdin is closed.
+
+        Stdin is read through an asyncio `StreamReader` where the event loop supports it.
+        On Windows, or if stdin cannot be connected as a pipe, lines are read in a
+        worker thread instead.
+        """
+        if sys.platform != "win32":
+            reader = asyncio.StreamReader()
+            protocol = asyncio.StreamReaderProtocol(reader)
+            try:
+                await self.loop.connect_read_pipe(lambda: protocol, sys.stdin)
+                return reader.readline
+            except (OSError, ValueError) as e:
+                print(f"Could not connect to stdin, reading it in a thread instead: {e}")
+
+        readline = sys.stdin.buffer.readline
+        return lambda: asyncio.to_thread(readline)
 
     async def listen_for_messages(self):
-        """Continuously listens for messages sent to Gummy via stdin."""
+        """Continuously listens for messages sent to Gummy via stdin once the bot is ready."""
+        await self.wait_until_ready()
         print("Listening.....")
+        read_line = self._read_line
+        handlers = self._handlers
         while True:
             try:
-                message = (await asyncio.to_thread(sys.stdin.readline)).strip()
+                line = await read_line()
+                if not line:
+                    print("Gummy's stdin was closed, no longer listening.")
+                    return
+
+                message = line.strip()
                 if not message:
                     print("Did not receive message from Gummy!")
                     continue
 
                 try:
-                    message_data = json.loads(message)
+                    message_data = json_loads(message)
                 except json.JSONDecodeError as e:
                     raise InvalidGummyMessage(f"Invalid message format: {message} caused error {e}.")
 
-                match(message_data.get("type")):
-                    case "presence":
-                        status = message_data.get("content")
-                        await self.change_presence(activity=discord.Game(name=status))
-                    case "command":
-                        channel = self.get_channel(int(message_data.get("channel_id")))
-                        if not channel:
-                            raise InvalidGummyMessageChannel("Invalid channel id.")
-
-                        content = message_data.get("content")
-                        if content == "ahoy":
-                            await channel.send("Ahoy! 🏴‍☠️")
-                    case "message":
-                        channel = self.get_channel(int(message_data.get("channel_id")))
-                        if not channel:
-                            raise InvalidGummyMessageChannel("Invalid channel id.")
-                        await channel.send(message_data.get("content"))
-
-            except InvalidGummyMessage as e:
+                handler = handlers.get(message_data.get("type"))
+                if not handler:
+                    raise InvalidGummyMessage(f"Unknown message type: {message_data.get('type')}.")
+
+                await handler(message_data)
+
+            except GummyMessageError as e:
                 print(f"[Gummy Error] {e}")
 
     async def setup_hook(self):
         self.session = aiohttp.ClientSession()
 
+        self._read_line = await self._open_stdin()
+
         print("Loading extensions...\n")
         await self.load_extension("cogs.gummy.gummy_settings")
         for filename in self.inital_extensions:
@@ -70,11 +147,18 @@ class GummyBot(commands.Bot):
             except commands.errors.ExtensionNotFound as e:
                 print(f"Error loading {filename}: {e}")
 
+        self._listen_task = asyncio.create_task(self.listen_for_messages())
+
     async def on_ready(self):
-        self.loop.create_task(self.listen_for_messages())
         print(f"\n{self.user.name} is now online!")
 
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._channel_cache.pop(str(channel.id), None)
+
     async def close(self):
+        if self._listen_task:
+            self._listen_task.cancel()
+
         await super().close()
         await self.session.close()
 
@@ -1,9 +1,7 @@
 import asyncio
 import discord
-import io
 import json
 import os
-import subprocess
 import sys
 
 from typing import Optional
@@ -15,6 +13,30 @@ from cogs.utils.errors.gummy_errors import (
     InvalidGummyMessageChannel
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+
+PRESENCE_PREFIX = b'{"type":"presence","content":'
+"""The start of every presence message, only the encoded status follows it."""
+
+
+def json_dumps(data):
+    """Returns the data encoded as JSON bytes, using `orjson` when it is installed.
+
+    Params:
+    -------
+        data : Any
+            The data to encode.
+    """
+    if orjson:
+        return orjson.dumps(data)
+
+    return json.dumps(data).encode()
+
 
 
 class LaunchGummy(commands.Cog):
@@ -24,42 +46,19 @@ class LaunchGummy(commands.Cog):
     ----------
         bot : commands.Bot
             The bot instance.
-        gummy : Popen|None
+        gummy : Process|None
             The current Gummy subprocess.
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.gummy: subprocess.Popen = None
+        self.gummy: asyncio.subprocess.Process = None
+        self._out_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._writer_task: asyncio.Task = None
 
     @property
     def gummy_active(self):
         """Whether or not the Gummy bot is online."""
-        return self.gummy and self.gummy.poll() is None
-
-    async def print_message(self, stream: io.TextIOWrapper, prefix: str):
-        """Reads and prints output from the Gummy process. 
-        Runs continously while the process is active.
-
-        Params:
-        -------
-        stream : TextIOWrapper
-            The stream to read from (stdout or stderr of Gummy's process).
-        prefix : str
-            A prefix to label the output type. Example outputs:
-
-            - `[Gummy] Gummy is now online!`
-            - `[Gummy Error] Could not read message`
-        """
-        if not stream:
-            print(f"{prefix} stream is None!")
-            return
-
-        while self.gummy_active:
-            line = await asyncio.to_thread(stream.readline)
-            if not line:
-                break
-
-            print(f"{prefix} {line.strip()}")
+        return self.gummy and self.gummy.returncode is None
 
     async def send_message(
         self, 
@@ -71,22 +70,61 @@ class LaunchGummy(commands.Cog):
         
         Params:
         -------
-            message : str
+            message_type : str
+                The type of message, which decides how Gummy handles it.
+            content : Optional[str]
                 The message to send to Gummy.
             channel : Optional[discord.TextChannel]
                 The channel where the message originated, if applicable.
         """
         if self.gummy_active:
-            message_data = {"type" : message_type, "content" : content}
-            if channel:
-                message_data["channel_id"] = str(channel.id)
+            if message_type == "presence" and not channel:
+                payload = PRESENCE_PREFIX + json_dumps(content) + b"}\n"
+            else:
+                message_data = {"type" : message_type, "content" : content}
+                if channel:
+                    message_data["channel_id"] = str(channel.id)
+
+                payload = json_dumps(message_data) + b"\n"
 
-            message_json = json.dumps(message_data)
-            self.gummy.stdin.write(f"{message_json}\n")
-            self.gummy.stdin.flush()
+            self._out_queue.put_nowait(payload)
         else:
             print("Can't send message to Gummy, he is not online!")
 
+    async def _write_messages(self, gummy: asyncio.subprocess.Process, queue: asyncio.Queue[bytes]):
+        """Writes queued messages to Gummy's stdin until Gummy exits.
+
+        Messages queued while a write is draining are sent together in the next write.
+
+        Params:
+        -------
+            gummy : Process
+                The Gummy subprocess to write to.
+            queue : asyncio.Queue[bytes]
+                The queue of encoded messages for that subprocess.
+        """
+        exited = asyncio.ensure_future(gummy.wait())
+        try:
+            while True:
+                next_payload = asyncio.ensure_future(queue.get())
+                await asyncio.wait((next_payload, exited), return_when=asyncio.FIRST_COMPLETED)
+                if not next_payload.done():
+                    next_payload.cancel()
+                    return
+
+                payloads = [next_payload.result()]
+                while not queue.empty():
+                    payloads.append(queue.get_nowait())
+
+                try:
+                    gummy.stdin.write(b"".join(payloads))
+                    await gummy.stdin.drain()
+                except ConnectionError:
+                    print("Gummy stopped reading messages!")
+                    return
+        finally:
+            exited.cancel()
+
     @commands.hybrid_command(name="ahoy")
     async def _say_ahoy(self, ctx: commands.Context):
         """Greets the user!"""
@@ -101,23 +139,21 @@ class LaunchGummy(commands.Cog):
                 raise GummyAlreadyRunning("Gummy is running already!")
 
             env = {**os.environ, "PYTHONUNBUFFERED": "1"}
-            self.gummy = subprocess.Popen(
-                [sys.executable, "-m", "cogs.gummy.gummy_bot"],
-                bufsize=1,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
+            self.gummy = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "cogs.gummy.gummy_bot",
+                stdin=asyncio.subprocess.PIPE,
                 env=env)
+            self._out_queue = asyncio.Queue()
+            if self._writer_task:
+                self._writer_task.cancel()
+
+            self._writer_task = asyncio.create_task(
+                self._write_messages(self.gummy, self._out_queue))
 
         except (GummyAlreadyRunning, GummyInitializeError) as e:
             print(e)
             return await ctx.send(e, delete_after=10)
 
-        asyncio.create_task(self.print_message(self.gummy.stdout, "[Gummy]"))
-        asyncio.create_task(self.print_message(self.gummy.stderr, "[Gummy]"))
-
         await asyncio.sleep(2)
         await self.send_message(message_type="presence", content=self.bot.game_status)
 
@@ -134,13 +170,15 @@ class LaunchGummy(commands.Cog):
             return await ctx.send(e, delete_after=10)
 
         print("Putting Gummy to sleep....")
+        self._writer_task.cancel()
         self.gummy.terminate()
 
         try:
-            self.gummy.wait(timeout=5)
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(self.gummy.wait(), timeout=5)
+        except asyncio.TimeoutError:
             print("Gummy would not go quietly....")
             self.gummy.kill()
+            await self.gummy.wait()
 
         self.gummy = None
         await ctx.send("Goodbye gummy!", delete_after=10)
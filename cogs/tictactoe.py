@@ -89,8 +89,7 @@ class TicTacToe(commands.Cog):
             symbol="❌", 
             is_bot=is_bot)
 
-        if (player_1.id in self.player_games or
-            player_2.id in self.player_games):
+        if not self.player_games.keys().isdisjoint((player_1.id, player_2.id)):
             return await ctx.send("One of the players is already in a game!")
 
         game = Game(self.bot, player_1, player_2)
@@ -99,11 +98,12 @@ class TicTacToe(commands.Cog):
         game.view = view
 
         self.player_games[player_1.id] = game
-        self.player_games[player_2.id] = game
+        if not is_bot:
+            self.player_games[player_2.id] = game
 
         embed = game.embed
-        game.board_message = await ctx.send(embed=embed, view=view)
-        game.turn_message = await ctx.send(f"{player_1.mention}, you are going first!")
+        game.board_message = await ctx.send(
+            f"{player_1.mention}, you are going first!", embed=embed, view=view)
 
     async def end_game(self, game: Game):
         """Sends the final state of the game cleans it up."""
@@ -126,10 +126,8 @@ class TicTacToe(commands.Cog):
         """
         await game.cleanup()
 
-        player_1 = game.player_1
-        player_2 = game.player_2
-        del self.player_games[player_1.member.id]
-        del self.player_games[player_2.member.id]
+        self.player_games.pop(game.player_1.id, None)
+        self.player_games.pop(game.player_2.id, None)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(TicTacToe(bot))
@@ -4,6 +4,7 @@ The `Tic-tac-toe` game package. Includes game elements and constants.
 
 
 
+from .botlogic import find_best_move
 from .game import Game
 from .game_view import GameView
 from .ttt_player import TTTPlayer
@@ -0,0 +1,177 @@
+"""Includes the `find_best_move(board, symbol, opponent_symbol)` function the bot uses to
+choose where to mark."""
+
+
+import random
+
+from typing import Callable
+from .ttt_board import TTTBoard
+
+
+
+SEARCH_MAX_SIZE = 3
+"""The largest board the bot searches completely, larger boards have too many positions."""
+
+EXACT, LOWER, UPPER = 0, 1, 2
+"""How a remembered score relates to the true score of its position."""
+
+_scores: dict[tuple[int, int, int], tuple[int, int]] = {}
+"""The remembered `(score, bound)` of each searched position, shared between all games.
+Positions are stored under the smallest of their rotations and reflections."""
+
+_symmetry_tables: dict[int, tuple[tuple[int, ...], ...]] = {}
+"""For each board size, the bitboard each bitboard becomes under each rotation and reflection."""
+
+
+
+def get_symmetry_tables(size: int):
+    """Returns, for each of the 8 rotations and reflections of a board of the given size,
+    a table of what every bitboard becomes.
+
+    The tables are only generated once for each board size.
+
+    Params:
+    -------
+        size : int
+            The size of the board.
+    """
+    if size not in _symmetry_tables:
+        last = size - 1
+        transforms = (
+            lambda y, x: (y, x),
+            lambda y, x: (x, last - y),
+            lambda y, x: (last - y, last - x),
+            lambda y, x: (last - x, y),
+            lambda y, x: (x, y),
+            lambda y, x: (y, last - x),
+            lambda y, x: (last - x, last - y),
+            lambda y, x: (last - y, x),
+        )
+
+        tables = []
+        for transform in transforms:
+            bits = [
+                1 << (ty * size + tx)
+                for ty, tx in (transform(*divmod(pos, size)) for pos in range(size * size))]
+
+            table = [0] * (1 << (size * size))
+            for bitboard in range(1, len(table)):
+                low_bit = bitboard & -bitboard
+                table[bitboard] = table[bitboard ^ low_bit] | bits[low_bit.bit_length() - 1]
+
+            tables.append(tuple(table))
+
+        _symmetry_tables[size] = tuple(tables)
+
+    return _symmetry_tables[size]
+
+
+
+def _alphabeta(
+    own: int,
+    opponent: int,
+    full_mask: int,
+    is_win: Callable[[int], bool],
+    symmetry_tables: tuple[tuple[int, ...], ...],
+    alpha: int,
+    beta: int):
+    """Returns the score of the position for the player about to move.
+
+    A win scores higher the sooner it happens, a loss lower, and a draw is `0`.
+
+    Params:
+    -------
+        own : int
+            The bitboard of the player about to move.
+        opponent : int
+            The bitboard of the player who just moved.
+        full_mask : int
+            The bitboard of a full board.
+        is_win : Callable[[int], bool]
+            The board's check for a bitboard filling any line.
+        symmetry_tables : tuple[tuple[int, ...], ...]
+            The board's symmetry tables, from `get_symmetry_tables`.
+        alpha : int
+            The score the player about to move is already guaranteed.
+        beta : int
+            The score the opponent is already guaranteed, as seen by the player to move.
+    """
+    empty = full_mask & ~(own | opponent)
+    if is_win(opponent):
+        return -1 - empty.bit_count()
+
+    if not empty:
+        return 0
+
+    key = (full_mask, *min((table[own], table[opponent]) for table in symmetry_tables))
+    entry = _scores.get(key)
+    if entry:
+        score, bound = entry
+        if bound == EXACT:
+            return score
+        if bound == LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return score
+
+    original_alpha = alpha
+    best = -full_mask
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+
+        score = -_alphabeta(
+            opponent, own | bit, full_mask, is_win, symmetry_tables, -beta, -alpha)
+        if score > best:
+            best = score
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+
+    if best <= original_alpha:
+        bound = UPPER
+    elif best >= beta:
+        bound = LOWER
+    else:
+        bound = EXACT
+
+    _scores[key] = (best, bound)
+    return best
+
+
+def find_best_move(board: TTTBoard, symbol: str, opponent_symbol: str):
+    """Returns the `(y, x)` location of the best move for the given symbol.
+
+    Every move is scored with an alpha-beta search, ties are broken randomly.
+
+    Params:
+    -------
+        board : TTTBoard
+            The game board.
+        symbol : str
+            The bot's symbol.
+        opponent_symbol : str
+            The opponent's symbol.
+    """
+    own = board.bitboards.get(symbol, 0)
+    opponent = board.bitboards.get(opponent_symbol, 0)
+    full_mask = board.full_mask
+    is_win = board.is_win
+    symmetry_tables = get_symmetry_tables(board.size)
+    bound = full_mask
+
+    best_score = None
+    best_moves: list[int] = []
+    for pos in board.empty:
+        score = -_alphabeta(
+            opponent, own | (1 << pos), full_mask, is_win, symmetry_tables, -bound, bound)
+        if best_score is None or score > best_score:
+            best_score = score
+            best_moves = [pos]
+        elif score == best_score:
+            best_moves.append(pos)
+
+    return divmod(random.choice(best_moves), board.size)
@@ -1,8 +1,8 @@
 import discord
 
-from asyncio import sleep
 from discord.ext import commands
 from random import choice
+from .botlogic import SEARCH_MAX_SIZE, find_best_move
 from .ttt_board import TTTBoard
 from .ttt_player import TTTPlayer
 
@@ -29,10 +29,12 @@ class Game:
         view : GameView
             The view used to display the game buttons.
         board_message : discord.Message
-            Used to send and edit the current board state.
-        turn_message : discord.Message
-            Used to send and edit the current turn status.
+            Used to send and edit the current board state, along with whose turn it is.
     """
+    __slots__ = (
+        "bot", "player_1", "player_2", "board", "current_player", "winner", "view",
+        "board_message")
+
     def __init__(self, bot: commands.Bot, player_1: TTTPlayer, player_2: TTTPlayer):
         self.bot = bot
         self.player_1 = player_1
@@ -43,7 +45,6 @@ class Game:
         self.winner: TTTPlayer = None
         self.view = None
         self.board_message: discord.Message = None
-        self.turn_message: discord.Message = None
 
     @property
     def embed(self):
@@ -55,24 +56,15 @@ class Game:
         """The current state of the board, determines if the game should end.
         
         If the current player has won, returns `win`. If the board is full, returns `draw`.
-        Otherwise, returns `ongoing` and the game continues.
+        Otherwise, returns `ongoing` and the game continues. Only the lines through the
+        last mark can have been completed, so only those are checked.
         """
-        board_size = self.board.size
-        symbol = self.current_player.symbol
-
-        for y in range(board_size):
-            if all(self.board[y][x] == symbol for x in range(board_size)):
-                return "win"
-        for x in range(board_size):
-            if all(self.board[y][x] == symbol for y in range(board_size)):
-                return "win"
-
-        if all(self.board[i][i] == symbol for i in range(board_size)):
-            return "win"
-        if all(self.board[i][board_size - i - 1] == symbol for i in range(board_size)):
+        board = self.board
+        last_mark = board.last_mark
+        if last_mark and board.has_won_at(*last_mark, self.current_player.symbol):
             return "win"
 
-        if self.board.is_full:
+        if board.is_full:
             return "draw"
 
         return "ongoing"
@@ -80,7 +72,7 @@ class Game:
     @property
     def bot_turn(self):
         """If it is the bot's turn."""
-        return self.current_player == self.player_2.member and self.player_2.is_bot
+        return self.current_player is self.player_2 and self.player_2.is_bot
 
     def _is_valid_loc(self, y: int, x: int):
         """Returns whether or not the location is valid.
@@ -92,10 +84,9 @@ class Game:
             x : int
                 The `x` location to check.
         """
-        return (
-            0 <= y < self.board.size and
-            0 <= x < self.board.size and
-            self.board[y][x] == self.board.default)
+        board = self.board
+        size = board.size
+        return 0 <= y < size and 0 <= x < size and board.is_open(y, x)
 
     def mark(self, y: int, x: int, symbol: str):
         """Checks if a location on the board is a valid location, and marks it.
@@ -123,10 +114,13 @@ class Game:
             member: discord.Member
                 The member object associated with the player to check.
         """
-        return self.current_player == member
+        return self.current_player.id == member.id
 
     async def next_turn(self, y: int, x: int):
         """Checks the game's state to determine if the game should continue and move to the next turn.
+
+        If it is then the bot's turn, its move is made right away so that both moves
+        are shown with a single edit.
         
         Params:
         -------
@@ -135,53 +129,75 @@ class Game:
             x : int
                 The `x` location on the board to place.
         """
-        embed = self.board.embed
-        await self.view.mark_button_tile(y, x, self.current_player.symbol)
-        self.board_message = await self.board_message.edit(embed=embed, view=self.view)
+        state = self._apply_move(y, x)
+        if state == "ongoing" and self.bot_turn:
+            state = self._apply_move(*self._do_bot_turn())
+
+        await self._flush(state)
+
+    def _apply_move(self, y: int, x: int):
+        """Marks the tile for the move just made, and passes the turn on if the game
+        continues. Returns the game's state after the move.
+
+        Params:
+        -------
+            y : int
+                The `y` location on the board that was placed.
+            x : int
+                The `x` location on the board that was placed.
+        """
+        self.view.mark_button_tile(y, x, self.current_player.symbol)
 
         state = self.game_state
         if state == "win":
             self.winner = self.current_player
+        elif state == "ongoing":
+            self.current_player = (
+                self.player_2 if self.current_player is self.player_1 else self.player_1)
+
+        return state
+
+    async def _flush(self, state: str):
+        """Edits the board message for the given game state, or ends the game.
+
+        The board and the turn status are shown in the same message, so each turn
+        is a single edit.
+
+        Params:
+        -------
+            state : str
+                The game's state after the last move.
+        """
+        embed = self.board.embed
+        if state != "ongoing":
+            self.board_message = await self.board_message.edit(
+                content=None, embed=embed, view=self.view)
             return await self.bot.get_cog("TicTacToe").end_game(game=self)
-        elif state == "draw":
-            return await self.bot.get_cog("TicTacToe").end_game(game=self)
 
-        self.current_player = (
-            self.player_2 if self.current_player == self.player_1.member else self.player_1)
-
-        await self._handle_turn_message()
-        if self.bot_turn:
-            await self._do_bot_turn()
-
-    async def _do_bot_turn(self):
-        """Represents the bot's turn, where it picks a random valid spot on the board."""
-        board_size = self.board.size
-        valid_locs = [
-            (y, x) for y in range(board_size) for x in range(board_size) if self._is_valid_loc(y, x)
-        ]
-
-        y, x = choice(valid_locs)
-        self.board.mark(y, x, self.current_player.symbol)
-        await self.next_turn(y, x)
-
-    async def _handle_turn_message(self):
-        """Sends a message indicating whose turn it is."""
-        if self.bot_turn:
-            self.turn_message = await self.turn_message.edit(content="It's now my turn!")
-            await sleep(3)
+        self.board_message = await self.board_message.edit(
+            content=f"{self.current_player.mention}, it is now your turn!",
+            embed=embed,
+            view=self.view)
+
+    def _do_bot_turn(self):
+        """Represents the bot's turn, where it picks the best spot on the board and marks it.
+
+        Boards too large to search fully get a random valid spot instead. Returns the
+        location that was marked.
+        """
+        board = self.board
+        symbol = self.current_player.symbol
+        if board.size <= SEARCH_MAX_SIZE:
+            y, x = find_best_move(board, symbol, self.player_1.symbol)
         else:
-            self.turn_message = await self.turn_message.edit(
-                content=f"{self.current_player.member.mention}, it is now your turn!")
+            y, x = divmod(choice(tuple(board.empty)), board.size)
+        board.mark(y, x, symbol)
+        return y, x
 
     async def cleanup(self):
         """Sends the final game state and disables the embed buttons."""
         await self.view.disable_all_tiles()
 
-        try:
-            await self.turn_message.delete()
-        except discord.errors.NotFound as e:
-            print(f"The turn message was not found: {e}")
-
         embed = self.board.embed
         embed.set_footer(text="This game has ended.")
         
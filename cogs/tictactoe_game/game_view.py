@@ -36,11 +36,14 @@ class GameView(discord.ui.View):
             The game instance to interact with.
         board : Board
             The board associated with the current game.
+        tiles : dict[str, Tile]
+            The tile buttons, keyed by their `custom id`.
     """
     def __init__(self, game: Game, timeout=None):
         super().__init__(timeout=timeout)
         self.game = game
         self.board = game.board
+        self.tiles: dict[str, Tile] = {}
         self._create_buttons()
         
     def _create_buttons(self):
@@ -56,6 +59,7 @@ class GameView(discord.ui.View):
 
                 tile.callback = self._select_tile
                 self.add_item(tile)
+                self.tiles[tile.custom_id] = tile
 
     async def _select_tile(self, interaction: discord.Interaction):
         """Callback function for when the player clicks a button tile.
@@ -63,27 +67,27 @@ class GameView(discord.ui.View):
         Checks if it is that player's turn, and marks the button tile to proceed
         to the next turn.
         """
-        if not self.game.is_player_turn(interaction.user):
-            return await interaction.response.send_message("It is not your turn!", delete_after=10)
+        game = self.game
+        response = interaction.response
+        if not game.is_player_turn(interaction.user):
+            return await response.send_message("It is not your turn!", delete_after=10)
 
-        current_player = self.game.current_player
-        custom_id = interaction.data["custom_id"]
-        symbol = current_player.symbol
+        current_player = game.current_player
+        tile = self.tiles[interaction.data["custom_id"]]
 
-        y, x = map(int, custom_id.split(":"))
-        if not self.game.mark(y, x, symbol):
-            return await interaction.response.send_message(
-                f"{current_player.member.mention}, that space is filled!", delete_after=10)
+        y, x = tile.y, tile.x
+        if not game.mark(y, x, current_player.symbol):
+            return await response.send_message(
+                f"{current_player.mention}, that space is filled!", delete_after=10)
 
-        await interaction.response.defer()
-        await self.mark_button_tile(y, x, symbol)
-        await self.game.next_turn(y, x)
+        await response.defer()
+        await game.next_turn(y, x)
 
-    async def mark_button_tile(self, y: int, x: int, symbol: str):
+    def mark_button_tile(self, y: int, x: int, symbol: str):
         """Marks the selected button tile with the player's symbol.
         
-        Finds the clicked tile by using the `y` and `x` location to get the tile's ID
-        and disables it afterwards.
+        Finds the clicked tile by its ID, built from the `y` and `x` location, and
+        disables it afterwards.
         
         Params:
         ------
@@ -94,13 +98,11 @@ class GameView(discord.ui.View):
             symbol : str
                 The player's symbol.
         """
-        for child in self.children:
-            if isinstance(child, Tile) and child.custom_id == f"{y}:{x}":
-                child.label = symbol
-                child.disabled = True
-                return
+        tile = self.tiles[f"{y}:{x}"]
+        tile.label = symbol
+        tile.disabled = True
 
     async def disable_all_tiles(self):
         """Disables all tile buttons for the game's embed."""
-        for child in self.children:
-            child.disabled = True
+        for tile in self.tiles.values():
+            tile.disabled = True
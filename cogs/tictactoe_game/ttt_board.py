@@ -1,5 +1,6 @@
 import discord
 
+from typing import Callable
 from ..game_elements import Board
 
 
@@ -13,19 +14,172 @@ class TTTBoard(Board):
             The `y` and `x` sizes of the board.
         grid : list[list[str]]
             A 2D grid representing the board that shows the placed symbols.
+        bitboards : dict[str, int]
+            The marks of each symbol, the mark at `(y, x)` is stored at bit `y * size + x`.
+        occupied : int
+            The marks of every symbol.
+        empty : set[int]
+            The bit positions of the unmarked spaces.
+        full_mask : int
+            The value of `occupied` once every space is marked.
+        win_masks : tuple[int, ...]
+            The masks of every row, column and diagonal.
+        is_win : Callable[[int], bool]
+            Returns whether or not a bitboard fills any line, with every mask written in.
+        cell_win_masks : tuple[tuple[int, ...], ...]
+            The masks of the lines through each space, indexed by its bit position.
+        last_mark : tuple[int, int]
+            The `(y, x)` location of the last mark.
     """
+    __slots__ = (
+        "bitboards", "occupied", "empty", "full_mask", "win_masks", "is_win",
+        "cell_win_masks", "last_mark", "_embed", "_embed_stale")
+
+    _win_masks: dict[int, tuple[int, ...]] = {}
+    _cell_win_masks: dict[int, tuple[tuple[int, ...], ...]] = {}
+    _win_checkers: dict[int, Callable[[int], bool]] = {}
+
     def __init__(self, size: int=3):
         super().__init__(size=size)
+        self.bitboards: dict[str, int] = {}
+        self.occupied = 0
+        self.empty = set(range(size * size))
+        self.full_mask = (1 << (size * size)) - 1
+        self.win_masks = self.get_win_masks(size)
+        self.is_win = self.get_win_checker(size)
+        self.cell_win_masks = self.get_cell_win_masks(size)
+        self.last_mark: tuple[int, int] = None
+        self._embed = discord.Embed(title="🚩 Tic-Tac-Toe! 🚩", color=discord.Color.red())
+        self._embed_stale = True
+
+    @classmethod
+    def get_win_masks(cls, size: int):
+        """Returns the masks of every row, column and diagonal for a board of the given size.
+
+        The masks are only generated once for each board size.
+
+        Params:
+        -------
+            size : int
+                The size of the board.
+        """
+        if size not in cls._win_masks:
+            lines = [[(y, x) for x in range(size)] for y in range(size)]
+            lines += [[(y, x) for y in range(size)] for x in range(size)]
+            lines.append([(i, i) for i in range(size)])
+            lines.append([(i, size - 1 - i) for i in range(size)])
+
+            cls._win_masks[size] = tuple(
+                sum(1 << (y * size + x) for y, x in line) for line in lines)
+
+        return cls._win_masks[size]
+
+    @classmethod
+    def get_win_checker(cls, size: int):
+        """Returns a function that checks a bitboard against every line of a board of the
+        given size.
+
+        The function is generated with each mask written in as a constant, so it runs
+        without a loop. It is only built once for each board size.
+
+        Params:
+        -------
+            size : int
+                The size of the board.
+        """
+        if size not in cls._win_checkers:
+            checks = " or ".join(
+                f"bitboard & {mask} == {mask}" for mask in cls.get_win_masks(size))
+            source = f"def is_win(bitboard):\n    return {checks}"
+
+            namespace = {}
+            exec(compile(source, f"<is_win{size}>", "exec"), namespace)
+            cls._win_checkers[size] = namespace["is_win"]
+
+        return cls._win_checkers[size]
+
+    @classmethod
+    def get_cell_win_masks(cls, size: int):
+        """Returns the masks of the lines through each space for a board of the given size.
+
+        The masks are only generated once for each board size.
+
+        Params:
+        -------
+            size : int
+                The size of the board.
+        """
+        if size not in cls._cell_win_masks:
+            win_masks = cls.get_win_masks(size)
+            cls._cell_win_masks[size] = tuple(
+                tuple(mask for mask in win_masks if mask >> pos & 1)
+                for pos in range(size * size))
+
+        return cls._cell_win_masks[size]
 
     @property
     def embed(self):
-        """An embed that shows the current state of the board."""
-        embed = discord.Embed(
-            title="🚩 Tic-Tac-Toe! 🚩",
-            description=f"{self}",
-            color=discord.Color.red())
+        """An embed that shows the current state of the board.
+
+        The same embed is returned every time, its description is only re-rendered
+        after the board changes.
+        """
+        if self._embed_stale:
+            self._embed.description = f"{self}"
+            self._embed_stale = False
+
+        return self._embed
+
+    @property
+    def is_full(self):
+        """If the board is full."""
+        return self.occupied == self.full_mask
+
+    def get_bit(self, y: int, x: int):
+        """Returns the bitboard bit for the given location.
+
+        Params:
+        -------
+            y : int
+                The `y` location.
+            x : int
+                The `x` location.
+        """
+        return 1 << (y * self.size + x)
+
+    def is_open(self, y: int, x: int):
+        """Returns whether or not the given location is unmarked.
+
+        Params:
+        -------
+            y : int
+                The `y` location.
+            x : int
+                The `x` location.
+        """
+        return not self.occupied & self.get_bit(y, x)
+
+    def has_won_at(self, y: int, x: int, symbol: str):
+        """Returns whether or not the given symbol fills a line through the given location.
+
+        Only the lines through that location are checked, so after each mark this is
+        enough to find a new win.
+
+        Params:
+        -------
+            y : int
+                The `y` location.
+            x : int
+                The `x` location.
+            symbol : str
+                The player's symbol to check.
+        """
+        bitboard = self.bitboards.get(symbol, 0)
+        for mask in self.cell_win_masks[y * self.size + x]:
+            if bitboard & mask == mask:
+                return True
 
-        return embed
+        return False
 
     def mark(self, y: int, x: int, symbol: str):
         """Marks the given location with the player's symbol.
@@ -39,4 +193,11 @@ class TTTBoard(Board):
             symbol : str
                 The player's symbol to place.
         """
+        pos = y * self.size + x
+        bit = 1 << pos
+        self.bitboards[symbol] = self.bitboards.get(symbol, 0) | bit
+        self.occupied |= bit
+        self.empty.discard(pos)
         self[y][x] = symbol
+        self.last_mark = (y, x)
+        self._embed_stale = True
@@ -22,11 +22,16 @@ interact with Discord APIs, providing functionality for user navigation through
 """
 
 
-from discord import Embed
+from collections import deque
 from typing import Optional
 
 
 
+MAX_EVENTS = 500
+"""The most events kept in a log, older events are dropped first."""
+
+
+
 class Event():
     """Represents an event with details of its type, participants, and ID.
     
@@ -40,8 +45,19 @@ class Event():
             Type of event.
         event : list[tuple[int, int]]
             Details of the `event` (coordinates).
+        descriptions : dict[str, str]
+            The description template for each type of event.
     """
     event_counter = 1
+    descriptions = {
+        "attack_hit" : "`{attacker}` hit `{defender}'s` ship by attacking `{event}`.",
+        "attack_miss" : "`{attacker}` missed by attacking `{event}`.",
+        "sank" : "`{attacker}` sank `{defender}'s` ship at `{event}`.",
+        "invalid_attack" : "`{attacker}` input an invalid attack at `{event}`.",
+        "start_game" : "A new game started between `{attacker}` and `{defender}`.",
+        "finished_game" : "`{attacker}` won the game against `{defender}`.",
+        "next_turn" : "It is `{attacker}'s` turn."
+    }
 
     def __init__(
         self, 
@@ -57,32 +73,16 @@ class Event():
 
     def __repr__(self):
         """Returns a formatted string representation of the event."""
-        attacker = self.participants[0]
-        defender = self.participants[1]
-
-        event_descriptions = {
-            "attack_hit" : f"`{attacker.member.name}` hit"
-                f" `{defender.member.name}'s` ship by attacking `{self.event}`.",
-
-            "attack_miss" : f"`{attacker.member.name}` missed"
-                f" by attacking `{self.event}`.",
-
-            "sank" : f"`{attacker.member.name}` sank"
-                f" `{defender.member.name}'s` ship at `{self.event}`.",
-
-            "invalid_attack" : f"`{attacker.member.name}` input an"
-                f" invalid attack at `{self.event}`.",
-
-            "start_game" : f"A new game started between `{attacker.member.name}`"
-                f" and `{defender.member.name}`.",
-
-            "finished_game" : f"`{attacker.member.name}` won the game against"
-                f" `{defender.member.name}`.",
+        template = Event.descriptions.get(self.event_type)
+        if not template:
+            return f"{self.event_id}) Unknown event"
 
-            "next_turn" : f"It is `{attacker.member.name}'s` turn."
-        }
+        description = template.format(
+            attacker=self.participants[0].name,
+            defender=self.participants[1].name,
+            event=self.event)
 
-        return f"{self.event_id}) {event_descriptions.get(self.event_type, 'Unknown event')}"
+        return f"{self.event_id}) {description}"
 
 
 class EventLog():
@@ -92,11 +92,12 @@ class EventLog():
     
     Attributes:
     -----------
-        events : list[Event]
-            The stored events.
+        lines : deque[str]
+            The text of each stored event, up to `MAX_EVENTS`, rendered once when
+            the event is added.
     """
     def __init__(self):
-        self.events: list[Event] = []
+        self.lines: deque[str] = deque(maxlen=MAX_EVENTS)
 
     def add_event(
         self, 
@@ -115,5 +116,4 @@ class EventLog():
             event : list[tuple[int, int]]
                 Details of the `event`.
         """
-        event = Event(participants, event_type, event)
-        self.events.append(event)
\ No newline at end of file
+        self.lines.append(repr(Event(participants, event_type, event)))
\ No newline at end of file
@@ -7,7 +7,8 @@ to ensure efficient loading and retrieval of JSON data.
 ### Key Features:
 - **JSON Loading and Caching**:
     - Loads JSON data from files and stores it in an internal cache for reuse.
-    - Returns cached data if the same file is requested again, preventing multiple reads.
+    - Returns cached data if the same, unchanged file is requested again, preventing multiple reads.
+    - Re-reads a file once its modification time changes.
   
 - **Error Handling**:
     - Handles `FileNotFoundError` and `JSONDecodeError` exceptions, ensuring the program 
@@ -22,13 +23,17 @@ to ensure efficient loading and retrieval of JSON data.
 
 ### Dependencies:
 - **`json`**: For parsing JSON data from files.
+- **`os`**: For checking the modification time of files.
+- **`pathlib`**: For reading the raw bytes of files.
 - **`typing`**: For type hinting and function signatures.
 """
 
 
 
 import json
+import os
 
+from pathlib import Path
 from typing import Optional
 
 
@@ -40,38 +45,49 @@ class JsonLoader:
 
     Attributes:
     -----------
-        _cache : dict[str, dict]
-            Stores the cached JSON data.
+        _cache : dict[str, tuple[Optional[int], dict]]
+            Stores the cached JSON data, along with the modification time of its file.
     """
-    _cache: dict[str, dict] = {}
+    _cache: dict[str, tuple[Optional[int], dict]] = {}
     
     @classmethod
     def load_json(cls, filename: str) -> dict[str, str]:
         """
         Loads JSON data from the specified file and caches it for future use.
 
-        This method checks if the JSON data for the given filename is already in the cache.
-        If not, it attempts to load the file and parse its contents. If successful, the data 
-        is stored in the cache. If the file cannot be found or is invalid, an empty dictionary 
-        is returned.
+        This method checks if the JSON data for the given filename is already in the cache,
+        and that the file has not been modified since. If not, it attempts to load the file
+        and parse its contents. If successful, the data is stored in the cache. If the file
+        cannot be found or is invalid, an empty dictionary is returned.
 
         Params:
         -------
             filename : str
                 The path to the JSON file to load.
         """
-        if filename not in cls._cache:
+        try:
+            mtime = os.stat(filename).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        cached = cls._cache.get(filename)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        data = {}
+        if mtime is None:
+            print(f"Unable to find file")
+        else:
             try:
-                with open(filename, "r") as f:
-                    cls._cache[filename] = json.load(f)
+                data = json.loads(Path(filename).read_bytes())
             except FileNotFoundError:
-                cls._cache[filename] = {}
+                mtime = None
                 print(f"Unable to find file")
             except json.JSONDecodeError:
-                cls._cache[filename] = {}
                 print(f"Unable to load file")
 
-        return cls._cache[filename]
+        cls._cache[filename] = (mtime, data)
+        return data
 
     @classmethod
     def clear_cache(cls, filename: Optional[str]=None):
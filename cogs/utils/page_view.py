@@ -41,8 +41,8 @@ class PageView(discord.ui.View):
             The maximum amount of items to display in one embed page.
         timeout : int
             The timeout for the page buttons, after which they are disabled.
-        pages : list[discord.Embed] 
-            The embed pages containing the stored items.
+        num_pages : int
+            The number of embed pages needed to show the stored items.
         page_num : int
             The current page index.
     """
@@ -53,34 +53,37 @@ class PageView(discord.ui.View):
         self.max_items_per_page = max_items_per_page
         
         self.page_num = 0
-        self.pages = self._generate_pages()
+        self.num_pages = max(1, -(-len(items) // max_items_per_page))
+        self._update_buttons()
         
-    def _generate_pages(self):
-        """Returns a list of embed pages that can be interacted with by using the `next` and `prev` buttons."""
-        pages_content = [
-            self.items[i:i + self.max_items_per_page]
-            for i in range(0, len(self.items), self.max_items_per_page)]
-        
-        if not pages_content:
-            return [discord.Embed(
-                title=self.title, 
+    def get_page(self, page_num: int):
+        """Returns the embed page at the given index.
+
+        Pages are built when they are shown, so only the pages that are viewed
+        are ever created.
+
+        Params:
+        -------
+            page_num : int
+                The index of the page.
+        """
+        if not self.items:
+            return discord.Embed(
+                title=self.title,
                 description="No items to display",
-                color=discord.Color.red())]
-
-        pages: list[discord.Embed] = []
-        for page_content in pages_content:
-            description = "\n".join(str(item) for item in page_content)
-            page = discord.Embed(
-                title=self.title, 
-                description=description, 
                 color=discord.Color.red())
 
-            page.set_footer(text=f"Page {len(pages) + 1} out of {len(pages_content)}")
-            pages.append(page)
+        start = page_num * self.max_items_per_page
+        page_content = self.items[start:start + self.max_items_per_page]
+        page = discord.Embed(
+            title=self.title,
+            description="\n".join(map(str, page_content)),
+            color=discord.Color.red())
 
-        return pages
+        page.set_footer(text=f"Page {page_num + 1} out of {self.num_pages}")
+        return page
     
-    def _update_buttons(self, interaction: discord.Interaction):
+    def _update_buttons(self):
         """Updates the view's buttons based on the current page.
         
         Disables the `next` button when at the last page,
@@ -89,11 +92,9 @@ class PageView(discord.ui.View):
         disable_prev = self.page_num == 0
         self._previous_button.disabled = disable_prev
         
-        disable_next = self.page_num == (len(self.pages) - 1)
+        disable_next = self.page_num == (self.num_pages - 1)
         self._next_button.disabled = disable_next
         
-        interaction.message.edit(view=self)
-        
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.blurple)
     async def _previous_button(
         self,
@@ -111,12 +112,11 @@ class PageView(discord.ui.View):
         """
         if self.page_num > 0:
             self.page_num -= 1
-            await interaction.response.edit_message(embed=self.pages[self.page_num])
+            self._update_buttons()
+            await interaction.response.edit_message(embed=self.get_page(self.page_num), view=self)
         else:
             await interaction.response.defer()
 
-        self._update_buttons(interaction)
-
     @discord.ui.button(label="Next", style=discord.ButtonStyle.blurple)
     async def _next_button(
         self,
@@ -132,10 +132,9 @@ class PageView(discord.ui.View):
             button : Button
                 The button object.
         """
-        if self.page_num < len(self.pages) - 1:
+        if self.page_num < self.num_pages - 1:
             self.page_num += 1
-            await interaction.response.edit_message(embed=self.pages[self.page_num])
+            self._update_buttons()
+            await interaction.response.edit_message(embed=self.get_page(self.page_num), view=self)
         else:
             await interaction.response.defer()
-
-        self._update_buttons(interaction)
@@ -24,10 +24,33 @@ class ProgressBar():
         The length of the tracked video, in seconds.
     size: int
         The length of the progress bar (in number of symbols).
+    bars: tuple[str, ...]
+        The bar for every slider position, from the start to the end.
     """
+    _bars: dict[int, tuple[str, ...]] = {}
+
     def __init__(self, vid_length: float):
         self.vid_length = vid_length
         self.size = 14
+        self.bars = self.get_bars(self.size)
+
+    @classmethod
+    def get_bars(cls, size: int):
+        """Returns the progress bar for every slider position of a bar with the given size.
+
+        The bars are only built once for each size.
+
+        Params:
+        ------
+            size: int
+                The length of the progress bar (in number of symbols).
+        """
+        if size not in cls._bars:
+            cls._bars[size] = tuple(
+                play_emoji + elapsed_emoji * position + circle_emoji + remaining_emoji * (size - position)
+                for position in range(size + 1))
+
+        return cls._bars[size]
 
     def is_complete(self, elapsed_time: float):
         """Returns if whether the video is completed or not.
@@ -47,16 +70,7 @@ class ProgressBar():
             elapsed_time: float
                 The elapsed time of the video, in seconds.
         """
-        
         if self.is_complete(elapsed_time):
-            string_bar = play_emoji + elapsed_emoji * self.size + circle_emoji
-            return string_bar
-        else:
-            percentage_elapsed = elapsed_time / self.vid_length
-            progress_position = round(self.size * percentage_elapsed)
-            remaining_time = self.size - progress_position
-
-            elapsed_line = play_emoji + (elapsed_emoji * progress_position) + circle_emoji
-            remaining_line = remaining_emoji * remaining_time
-            string_bar = elapsed_line + remaining_line
-            return string_bar
+            return self.bars[-1]
+
+        return self.bars[round(self.size * elapsed_time / self.vid_length)]
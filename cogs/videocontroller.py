@@ -218,7 +218,7 @@ class VideoController(commands.Cog):
             items=player.video_playlist.upcoming,
             max_items_per_page=30)
 
-        player.playlist_message = await ctx.send(embed=view.pages[0], view=view)
+        player.playlist_message = await ctx.send(embed=view.get_page(0), view=view)
 
     @commands.hybrid_command(name='pause')
     async def _pause(self, ctx: commands.Context):